@@ -11,6 +11,8 @@ Features:
 - Path normalization for output directories
 """
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -60,8 +62,22 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """Return the cached application settings instance.
+
+    Instantiating Settings reads and validates the .env file; caching the
+    instance ensures that cost is paid once per process no matter how many
+    modules request the configuration.
+
+    Returns:
+        Settings: The validated application settings.
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
 
 # Initialize logging configuration
 logger = LogManager(
@@ -5,10 +5,103 @@ incrementally. It includes custom exception classes and utility functions for pa
 and tokenizing JSON strings.
 """
 
-from typing import Any, Union
+import json
+import re
+import threading
+from sys import intern
+from typing import Any, Final, Union
 
 from config import logger
 
+# Precompiled whitespace matcher. re.Match.end() lands in CPython's
+# C-implemented SRE engine, so skipping a run of whitespace costs a single
+# call instead of one bytecode-dispatched comparison per character.
+_WS_RE = re.compile(r"\s*")
+
+
+def _intern_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """Builds an object dict with short keys interned.
+
+    Used as the fast-path decoder's object_pairs_hook so keys repeated
+    across streamed documents share one string object, matching the
+    interning the streaming path applies to completed keys.
+
+    Args:
+        pairs: The decoded (key, value) pairs of one JSON object.
+
+    Returns:
+        dict[str, Any]: The object with keys up to 64 characters interned.
+    """
+    return {intern(k) if len(k) <= 64 else k: v for k, v in pairs}
+
+
+def _reject_constant(constant: str) -> None:
+    """Rejects the non-standard constants NaN, Infinity and -Infinity.
+
+    Used as the fast-path decoder's parse_constant hook so it fails on input
+    the streaming path (and orjson, when installed) treats as malformed;
+    consume() then falls back to the streaming loop, which raises
+    MalformedJSON. Without this, results would depend on whether orjson is
+    importable.
+
+    Args:
+        constant: The constant text encountered by the decoder.
+
+    Raises:
+        ValueError: Always, to make raw_decode fail on the document.
+    """
+    raise ValueError(f"non-standard JSON constant: {constant}")
+
+
+# Shared decoder for the complete-document fast path in consume().
+_DECODER = json.JSONDecoder(
+    object_pairs_hook=_intern_pairs, parse_constant=_reject_constant
+)
+
+# Optional accelerated decoder for the fast path; orjson caches short keys
+# internally, so key deduplication is preserved without the pairs hook.
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+# Per-thread parser cache for get_thread_local().
+_THREAD_LOCAL = threading.local()
+
+# Free-list of released parsers for acquire()/release(); bounded so a burst
+# of traffic cannot pin memory forever. The lock makes pop and bounded append
+# atomic so concurrent acquire/release cannot race.
+_POOL: list["StreamJsonParser"] = []
+_POOL_MAX = 64
+_POOL_LOCK = threading.Lock()
+
+# Parser states as module-level int constants; comparisons in the token loop
+# are single integer tests instead of string comparisons, and the loads are
+# plain globals rather than enum attribute lookups. None means "no document
+# started yet".
+_STATE_KEY: Final[int] = 1
+_STATE_VALUE: Final[int] = 2
+_STATE_COMMA: Final[int] = 3
+
+# Every proper prefix of the JSON literals; a bare value token must be one of
+# these to be a plausible partial literal, anything else is malformed.
+_LITERAL_PREFIXES = frozenset(
+    lit[:i] for lit in ("true", "false", "null") for i in range(1, len(lit))
+)
+
+# Single-pass tokenizer pattern. Alternatives mirror the branches of the old
+# hand-rolled scanner, in priority order: structural characters, strings
+# (possibly unterminated, possibly ending in a dangling backslash), numbers,
+# and bare text runs. Whitespace matches no alternative and is skipped by
+# finditer for free. DOTALL lets an escape sequence cover a newline.
+_TOKEN_RE = re.compile(
+    r"[\[\]{}:,]"
+    r'|"(?:\\.|[^"\\])*\\?"?'
+    r"|[+\-0-9][0-9.+\-eE]*"
+    r"|[^\s\[\]{}:,]+",
+    re.DOTALL,
+)
+
 
 class StreamParserJSONDecodeError(ValueError):
     """Base class for JSON parsing errors in the stream parser.
@@ -57,78 +150,57 @@ class MalformedJSON(StreamParserJSONDecodeError):
     pass
 
 
-def scan(json_string: str) -> list[tuple[int, str]]:
+def _find_closing_quote(
+    json_string: str, start: int = 0, leading_backslashes: int = 0
+) -> int:
+    """Finds the first unescaped double quote in a string.
+
+    A quote preceded by an odd number of backslashes is escaped and does not
+    terminate the string.
+
+    Args:
+        json_string: The string to search.
+        start: The index to start searching from.
+        leading_backslashes: Length of a backslash run immediately preceding
+            json_string[start], for strings whose earlier content arrived in
+            previous chunks; a backslash run touching the start position
+            continues it.
+
+    Returns:
+        int: The index of the closing quote, or -1 if none is found.
+    """
+    i = start
+    while True:
+        pos = json_string.find('"', i)
+        if pos == -1:
+            return -1
+        backslashes = 0
+        while pos - backslashes > i and json_string[pos - backslashes - 1] == "\\":
+            backslashes += 1
+        if i == start and pos - backslashes == start:
+            backslashes += leading_backslashes
+        if backslashes % 2 == 0:
+            return pos
+        i = pos + 1
+
+
+def scan(json_string: str, start: int = 0) -> list[tuple[int, str]]:
     """Tokenizes a JSON-like string with emphasis on structural characters.
-    
-    This version inlines helper routines to reduce function-call overhead,
-    which can yield significant speedups.
-    
+
+    This version runs a single precompiled regex pass over the input, so all
+    per-character work (whitespace skipping, string-end scanning, number and
+    text runs) happens inside CPython's C-implemented regex engine.
+
     Args:
         json_string: The input string to be tokenized.
-    
+        start: The index to start tokenizing from.
+
     Returns:
         A list of tuples where each tuple contains:
             - Position (int): The starting index of the token in the input string.
             - Token (str): The actual token string.
     """
-    tokens = []
-    i = 0
-    length = len(json_string)
-    # Structural characters as a string literal (membership check in a small string is fast)
-    structural = "[]{}:,"
-
-    while i < length:
-        c = json_string[i]
-
-        # Skip whitespace.
-        if c.isspace():
-            i += 1
-            continue
-
-        # Structural characters become single tokens.
-        if c in structural:
-            tokens.append((i, c))
-            i += 1
-            continue
-
-        # If it starts with a double quote, parse a string.
-        if c == '"':
-            start = i
-            i += 1  # Skip the opening quote.
-            escaped = False
-            while i < length:
-                ch = json_string[i]
-                if escaped:
-                    escaped = False
-                    i += 1
-                elif ch == '\\':
-                    escaped = True
-                    i += 1
-                elif ch == '"':
-                    i += 1  # Include the closing quote.
-                    break
-                else:
-                    i += 1
-            tokens.append((start, json_string[start:i]))
-            continue
-
-        # If the token starts with a number character, parse a number.
-        if c in "+-0123456789":
-            start = i
-            i += 1  # Consume the sign or first digit.
-            while i < length and json_string[i] in "0123456789.-+eE":
-                i += 1
-            tokens.append((start, json_string[start:i]))
-            continue
-
-        # Otherwise, consume text until whitespace or a structural character is encountered.
-        start = i
-        while i < length and (not json_string[i].isspace() and json_string[i] not in structural):
-            i += 1
-        tokens.append((start, json_string[start:i]))
-
-    return tokens
-
+    return [(m.start(), m.group()) for m in _TOKEN_RE.finditer(json_string, start)]
 
 
 class StreamJsonParser:
@@ -150,6 +222,18 @@ class StreamJsonParser:
         partial (bool): Indicates if the parsed JSON is incomplete.
     """
 
+    __slots__ = (
+        "stack",
+        "root",
+        "in_string",
+        "last_key",
+        "last_string_start",
+        "last_string_end",
+        "state",
+        "partial",
+        "_partial_parts",
+    )
+
     def __init__(self):
         self.stack = []
         self.root = None
@@ -159,114 +243,302 @@ class StreamJsonParser:
         self.last_string_end = -1
         self.state = None
         self.partial = False
+        # Pieces of the in-progress partial value, joined only on completion
+        # or on get(); reused across values to avoid list churn.
+        self._partial_parts = []
+
+    def reset(self) -> None:
+        """Resets the parser for a new document without reallocating.
+
+        Clears all parsing state in place so a long-lived parser can be
+        reused across messages instead of constructing a new instance per
+        document.
+        """
+        self.stack.clear()
+        self.root = None
+        self.in_string = False
+        self.last_key = None
+        self.last_string_start = -1
+        self.last_string_end = -1
+        self.state = None
+        self.partial = False
+        self._partial_parts.clear()
+
+    @classmethod
+    def acquire(cls) -> "StreamJsonParser":
+        """Returns a parser from the free-list, or a new one if it is empty.
+
+        High-QPS callers that parse one document per request can pair this
+        with release() to skip the per-request parser allocation. The pool
+        is shared across threads and guarded by a lock.
+
+        Returns:
+            StreamJsonParser: A parser ready to consume a new document.
+        """
+        with _POOL_LOCK:
+            if _POOL:
+                return _POOL.pop()
+        return cls()
+
+    def release(self) -> None:
+        """Resets this parser and returns it to the free-list.
+
+        The caller must not use the instance after releasing it. Parsers
+        beyond the pool capacity are simply dropped for the garbage
+        collector.
+        """
+        self.reset()
+        with _POOL_LOCK:
+            if len(_POOL) < _POOL_MAX:
+                _POOL.append(self)
+
+    @classmethod
+    def get_thread_local(cls) -> "StreamJsonParser":
+        """Returns a parser instance cached per thread.
+
+        Server workloads that parse many messages can call this instead of
+        constructing a parser per message; pair with reset() between
+        documents.
+
+        Returns:
+            StreamJsonParser: The calling thread's cached parser instance.
+        """
+        parser = getattr(_THREAD_LOCAL, "parser", None)
+        if parser is None:
+            parser = _THREAD_LOCAL.parser = cls()
+        return parser
+
+    def _open_object(self) -> None:
+        """Pushes a new object for a '{' token.
+
+        Raises:
+            MalformedJSON: If a second root or an object in key position is opened.
+        """
+        obj = {}
+        if not self.stack:
+            if self.root is not None:
+                logger.error("invalid object: double root")
+                raise MalformedJSON("invalid object: no parent container")
+            self.stack.append(obj)
+        else:
+            top = self.stack[-1]
+            if isinstance(top, dict):
+                if self.state != _STATE_VALUE:
+                    logger.error(
+                        "invalid object: unexpected self.state, waiting for object value"
+                    )
+                    raise MalformedJSON(
+                        "invalid object: unexpected self.state, waiting for object value"
+                    )
+                top[self.last_key] = obj
+            else:
+                top.append(obj)
+
+            self.stack.append(obj)
+        self.state = _STATE_KEY
+
+    def _open_array(self) -> None:
+        """Pushes a new array for a '[' token.
+
+        Raises:
+            MalformedJSON: If a second root or an array in key position is opened.
+        """
+        arr = []
+        if not self.stack:
+            if self.root is not None:
+                logger.error("invalid array: double root")
+                raise MalformedJSON("invalid array: no parent container")
+            self.stack.append(arr)
+        else:
+            top = self.stack[-1]
+            if isinstance(top, dict):
+                if self.state != _STATE_VALUE:
+                    logger.error(
+                        "invalid array: unexpected self.state, waiting for array value"
+                    )
+                    raise MalformedJSON(
+                        "invalid array: unexpected self.state, waiting for array value"
+                    )
+                top[self.last_key] = arr
+            else:
+                top.append(arr)
+
+            self.stack.append(arr)
+        self.state = _STATE_VALUE
+
+    def _close_object(self) -> None:
+        """Pops the current object for a '}' token.
+
+        Raises:
+            MalformedJSON: If the innermost open container is not an object.
+        """
+        if not self.stack or not isinstance(self.stack[-1], dict):
+            logger.error("invalid object: expected dict to close object")
+            raise MalformedJSON("invalid object: expected dict to close object")
+
+        container = self.stack.pop()
+        if not self.stack:
+            self.root = container
+        self.state = _STATE_COMMA
+
+    def _close_array(self) -> None:
+        """Pops the current array for a ']' token.
+
+        Raises:
+            MalformedJSON: If the innermost open container is not an array.
+        """
+        if not self.stack or not isinstance(self.stack[-1], list):
+            logger.error("invalid array: expected list to close array")
+            raise MalformedJSON("invalid array: expected list to close array")
+
+        container = self.stack.pop()
+        if not self.stack:
+            self.root = container
+        self.state = _STATE_COMMA
+
+    def _colon(self) -> None:
+        """Switches to value position for a ':' token.
+
+        Raises:
+            MalformedJSON: If the preceding key string was never closed.
+        """
+        if self.state == _STATE_KEY and self.partial:
+            raise MalformedJSON(
+                "invalid object: the object key was not properly closed"
+            )
+        self.state = _STATE_VALUE
+
+    def _comma(self) -> None:
+        """Advances to the next key or element for a ',' token.
+
+        Raises:
+            MalformedJSON: If no value has been completed before the comma.
+        """
+        if not self.partial and self.state != _STATE_COMMA:
+            raise MalformedJSON("invalid object: no value processed")
+
+        self.state = _STATE_KEY if isinstance(self.stack[-1], dict) else _STATE_VALUE
+        if self.state == _STATE_KEY:
+            self.last_key = None
+
+    # Jump table for structural tokens: one dict lookup replaces the chain of
+    # equality tests that every token otherwise walked through.
+    _DISPATCH = {
+        "{": _open_object,
+        "[": _open_array,
+        "}": _close_object,
+        "]": _close_array,
+        ":": _colon,
+        ",": _comma,
+    }
 
     def consume(self, json_str: str) -> None:
         if not len(json_str):
             return None
 
-        tokens = scan(json_str)
+        # Fast path: a pristine parser fed one complete document can hand the
+        # whole chunk to the C-implemented json decoder instead of tokenizing.
+        # The streaming parser keeps escape sequences raw, json.loads decodes
+        # them, so only chunks without backslashes are eligible.
+        if (
+            self.state is None
+            and not self.stack
+            and self.root is None
+            and "\\" not in json_str
+        ):
+            # common case: no leading whitespace, skip the regex entirely
+            first = 0 if json_str[0] in "{[" else _WS_RE.match(json_str).end()
+            if first < len(json_str) and json_str[first] in "{[":
+                if _orjson_loads is not None:
+                    # orjson rejects trailing data itself, so no tail check
+                    try:
+                        obj = _orjson_loads(json_str)
+                    except ValueError:
+                        pass
+                    else:
+                        self.root = obj
+                        self.state = _STATE_COMMA
+                        return None
+                else:
+                    try:
+                        obj, end = _DECODER.raw_decode(json_str, first)
+                    except (ValueError, RecursionError):
+                        # raw_decode recurses per nesting level; the streaming
+                        # loop below is iterative and handles any depth
+                        pass
+                    else:
+                        if _WS_RE.match(json_str, end).end() == len(json_str):
+                            self.root = obj
+                            self.state = _STATE_COMMA
+                            return None
+
+        # An open string value swallows the chunk up to its closing quote
+        # before tokenization: the content is raw text, so handing it to the
+        # tokenizer would misread pieces like '34"}' as a number token and a
+        # fresh string, and would drop whitespace inside the value.
+        scan_start = 0
+        if self.partial and self.in_string and self.state == _STATE_VALUE:
+            parts = self._partial_parts
+            # a backslash run ending the accumulated content carries its
+            # escape parity into this chunk, so a quote at the boundary is
+            # not necessarily a terminator (and vice versa)
+            carry = 0
+            for piece in reversed(parts):
+                trailing = len(piece) - len(piece.rstrip("\\"))
+                carry += trailing
+                if trailing < len(piece):
+                    break
+            close = _find_closing_quote(json_str, 0, carry)
+            if close == -1:
+                parts.append(json_str)
+                return None
+            parts.append(json_str[:close])
+            value = "".join(parts)
+            parts.clear()
+            self.partial = False
+            self.in_string = False
+            top = self.stack[-1]
+            if isinstance(top, dict):
+                top[self.last_key] = value
+            else:
+                top[-1] = value
+            self.state = _STATE_COMMA
+            scan_start = close + 1
+
+        tokens = scan(json_str, scan_start)
         tokens_len = len(tokens)
         str_len = len(json_str)
 
-        # we handle the case when the whole string is just some value not enclosed in quotes
-        # example: "{"key": [ -> hello -> , 12345 -> ]}"
+        # a chunk that produces no tokens is whitespace-only: before any
+        # document has started that is not a valid root, mid-stream it is
+        # simply a no-op
         if tokens_len == 0 and str_len > 0:
             if self.state is None and not self.stack:
                 raise MalformedJSON(
                     "invalid json, some random value as root is invalid"
                 )
-            tokens.append((0, json_str))
-
-        # check if there is a partial string after the last token index in json_str
-        # if there is a pratial string, then add the `"` and it index to tokens
-        has_partial_string = '"' in json_str[tokens[-1][0] + len(tokens[-1][1]) :]
-        if has_partial_string:
-            # get the index of the partial string
-            quote_index = tokens[-1][0] + 1 + json_str[tokens[-1][0] + 1 :].index('"')
-            tokens.append((quote_index, json_str[quote_index:]))
-            tokens_len += 1
+            # mid-stream chunk with no tokens is whitespace-only: nothing to do
+            return None
 
+        # Hoist loop-invariant attribute loads; stack is only ever mutated in
+        # place, so the local alias stays valid across handler calls.
+        dispatch = self._DISPATCH
+        stack = self.stack
         i = 0
         while i < tokens_len:
             index, char = tokens[i]
-            if char == "{":
-                obj = {}
-                if not self.stack:
-                    if self.root is not None:
-                        logger.error("invalid object: double root")
-                        raise MalformedJSON("invalid object: no parent container")
-                    self.stack.append(obj)
-                else:
-                    if isinstance(self.stack[-1], dict):
-                        if self.state != "value":
-                            logger.error(
-                                "invalid object: unexpected self.state, waiting for object value"
-                            )
-                            raise MalformedJSON(
-                                "invalid object: unexpected self.state, waiting for object value"
-                            )
-                        self.stack[-1][self.last_key] = obj
-                    else:
-                        self.stack[-1].append(obj)
-
-                    self.stack.append(obj)
-                self.state = "key"
-            elif char == "[":
-                arr = []
-                if not self.stack:
-                    if self.root is not None:
-                        logger.error("invalid array: double root")
-                        raise MalformedJSON("invalid array: no parent container")
-                    self.stack.append(arr)
-                else:
-                    if isinstance(self.stack[-1], dict):
-                        if self.state != "value":
-                            logger.error(
-                                "invalid array: unexpected self.state, waiting for array value"
-                            )
-                            raise MalformedJSON(
-                                "invalid array: unexpected self.state, waiting for array value"
-                            )
-                        self.stack[-1][self.last_key] = arr
-                    else:
-                        self.stack[-1].append(arr)
-
-                    self.stack.append(arr)
-                self.state = "value"
-            elif char == "}":
-                if not self.stack or not isinstance(self.stack[-1], dict):
-                    logger.error("invalid object: expected dict to close object")
-                    raise MalformedJSON("invalid object: expected dict to close object")
-
-                container = self.stack.pop()
-                if not self.stack:
-                    self.root = container
-            elif char == "]":
-                if not self.stack or not isinstance(self.stack[-1], list):
-                    logger.error("invalid array: expected list to close array")
-                    raise MalformedJSON("invalid array: expected list to close array")
-
-                container = self.stack.pop()
-                if not self.stack:
-                    self.root = container
-            elif char == ":":
-                if self.state == "key" and self.partial:
-                    raise MalformedJSON(
-                        "invalid object: the object key was not properly closed"
-                    )
-                self.state = "value"
-            elif char == ",":
-                if not self.partial and self.state != "comma":
-                    raise MalformedJSON("invalid object: no value processed")
-
-                self.state = "key" if isinstance(self.stack[-1], dict) else "value"
-                if self.state == "key":
-                    self.last_key = None
+            handler = dispatch.get(char)
+            if handler is not None:
+                handler(self)
             else:
-                if self.state == "key":
+                if self.state == _STATE_KEY:
                     if self.partial:
                         self.partial = not char[-1] == '"'
-                        self.last_key += char[:-1]
+                        # only a terminating quote is stripped; anything else
+                        # is key content that continues in a later chunk
+                        self.last_key += char if self.partial else char[:-1]
+                        if not self.partial and len(self.last_key) <= 64:
+                            self.last_key = intern(self.last_key)
                     elif char[0] != '"':
                         logger.error("invalid key: expected string")
                         raise MalformedJSON("invalid key: expected string")
@@ -274,91 +546,106 @@ class StreamJsonParser:
                         self.partial = not (
                             char[0] == '"' and len(char) > 1 and char[-1] == '"'
                         )
-                        if len(char) > 1:
+                        if len(char) > 2 and not self.partial:
+                            # complete key: intern so repeated keys across
+                            # messages share one string object
+                            key = char[1:-1]
+                            self.last_key = intern(key) if len(key) <= 64 else key
+                        elif len(char) > 1:
                             self.last_key = char[1:] if self.partial else char[1:-1]
                         else:
                             self.last_key = ""
 
-                elif self.state == "value":
+                elif self.state == _STATE_VALUE:
                     if self.partial:
-                        current_value = (
-                            self.stack[-1][self.last_key]
-                            if isinstance(self.stack[-1], dict)
-                            else self.stack[-1][-1]
-                        )
-                        value = current_value + char
-                        if value in ["null", "true", "false"]:
+                        # only bare literal continuations reach here; an open
+                        # string is consumed before tokenization, so the
+                        # accumulation is a single short piece and guessing a
+                        # string's type from it can no longer happen
+                        parts = self._partial_parts
+                        candidate = parts[0] + char
+
+                        value = None
+                        if candidate in ["null", "true", "false"]:
                             self.partial = False
-                            if value in "null":
-                                value = None
-                            elif value == "true":
+                            if candidate == "true":
                                 value = True
-                            elif value == "false":
+                            elif candidate == "false":
                                 value = False
-                        elif value[0] in "0123456789+-.":
-                            try:
-                                value = (
-                                    float(value)
-                                    if "e" in value.lower() or "." in value
-                                    else int(value)
-                                )
-                                self.partial = False
-                            except ValueError:
-                                raise MalformedJSON("invalid number")
-                        else:
-                            # can be a partial string
-                            self.partial = not char[-1] == '"'
-                            value = char[:-1] if char[-1] == '"' else char
-
-                        if isinstance(self.stack[-1], dict):
-                            self.stack[-1][self.last_key] = (
-                                self.stack[-1][self.last_key] + value
-                            )
+                        elif candidate not in _LITERAL_PREFIXES:
+                            # same validation as a fresh bare token: the
+                            # accumulation must still be on its way to a
+                            # literal
+                            logger.error("invalid value: not a json literal")
+                            raise MalformedJSON("invalid value: not a json literal")
                         else:
-                            self.stack[-1][-1] = self.stack[-1][-1] + value
+                            # still only part of a literal; keep accumulating
+                            # and mirror the text into the container so get()
+                            # stays consistent
+                            parts[0] = candidate
+                            top = stack[-1]
+                            if isinstance(top, dict):
+                                top[self.last_key] = candidate
+                            else:
+                                top[-1] = candidate
 
-                        # at this point the current char can be a state transition char
-                        # therefore, do not move forward
                         if not self.partial:
-                            self.state = "comma"
+                            parts.clear()
+                            top = stack[-1]
+                            if isinstance(top, dict):
+                                top[self.last_key] = value
+                            else:
+                                top[-1] = value
+                            self.state = _STATE_COMMA
 
                         i += 1
                         continue
 
-                    if char[0] == '"':
+                    # dispatch on the first character: strings and numbers are
+                    # by far the most common values, so test them before the
+                    # whole-token literal comparisons
+                    c0 = char[0]
+                    if c0 == '"':
                         if len(char) < 2 or char[-1] != '"':
                             self.partial = True
+                            self.in_string = True
                         if len(char) > 1:
                             value = char[1:] if self.partial else char[1:-1]
                         else:
                             value = ""
-                    elif char == "null":
-                        value = None
-                    elif char == "true":
-                        value = True
-                    elif char == "false":
-                        value = False
-                    elif char[0] in "0123456789+-.":
+                    elif c0 in "0123456789+-.":
                         try:
                             value = (
                                 float(char)
-                                if "e" in char.lower() or "." in char
+                                if "." in char or "e" in char or "E" in char
                                 else int(char)
                             )
                         except ValueError:
                             raise MalformedJSON("invalid number")
+                    elif c0 == "n" and char == "null":
+                        value = None
+                    elif c0 == "t" and char == "true":
+                        value = True
+                    elif c0 == "f" and char == "false":
+                        value = False
                     else:
                         # it can be we have a partial value for null, true, false
+                        if char not in _LITERAL_PREFIXES:
+                            logger.error("invalid value: not a json literal")
+                            raise MalformedJSON("invalid value: not a json literal")
                         self.partial = True
                         value = char
 
-                    if isinstance(self.stack[-1], dict):
-                        self.stack[-1][self.last_key] = value
+                    top = stack[-1]
+                    if isinstance(top, dict):
+                        top[self.last_key] = value
                     else:
-                        self.stack[-1].append(value)
+                        top.append(value)
 
-                    if not self.partial:
-                        self.state = "comma"
+                    if self.partial:
+                        self._partial_parts.append(value)
+                    else:
+                        self.state = _STATE_COMMA
             i += 1
 
     def get(self) -> Union[dict[Any], list[Any], None]:
@@ -367,6 +654,17 @@ class StreamJsonParser:
         Returns:
             Union[dict[Any], list[Any], None]: The parsed JSON object or None if no valid JSON has been parsed.
         """
+        # Materialize an in-progress partial value so callers see everything
+        # consumed so far; collapse the pieces so repeated get() stays cheap.
+        if self.partial and self.state == _STATE_VALUE and len(self._partial_parts) > 1:
+            joined = "".join(self._partial_parts)
+            self._partial_parts[:] = [joined]
+            top = self.stack[-1]
+            if isinstance(top, dict):
+                top[self.last_key] = joined
+            else:
+                top[-1] = joined
+
         if self.root is not None and not self.stack:
             return self.root
 
@@ -1,5 +1,8 @@
+import threading
+
 import pytest
 
+import stream_parser
 from config import logger
 from stream_parser import StreamJsonParser, StreamParserJSONDecodeError
 
@@ -473,6 +476,77 @@ class TestStreamJsonParser:
                 parser.consume(json_input)
                 parser.get()
 
+    def test_object_string_value_chunk_looks_like_number(self, parser):
+        """Test string value split where the continuation looks like a number."""
+        parser.consume('{"a": "12')
+        parser.consume('34"}')
+        actual = parser.get()
+        assert actual == {"a": "1234"}
+
+    def test_object_string_value_chunk_looks_like_literal(self, parser):
+        """Test string value split where the continuation completes a literal."""
+        parser.consume('{"a": "tr')
+        parser.consume("ue")
+        parser.consume(' more"}')
+        actual = parser.get()
+        assert actual == {"a": "true more"}
+
+    def test_object_string_value_whitespace_across_chunks(self, parser):
+        """Test that whitespace inside a split string value is preserved."""
+        parser.consume('{"a": "hello ')
+        parser.consume('world"}')
+        actual = parser.get()
+        assert actual == {"a": "hello world"}
+
+    def test_object_string_value_split_after_backslash(self, parser):
+        """Test string value split right after a backslash."""
+        parser.consume('{"a": "x\\')
+        parser.consume('"more"}')
+        actual = parser.get()
+        assert actual == {"a": 'x\\"more'}
+
+    def test_object_string_value_split_inside_escaped_backslash(self, parser):
+        """Test that a real closing quote after a split escape still closes."""
+        parser.consume('{"k": "bs\\')
+        parser.consume('\\"}')
+        actual = parser.get()
+        assert actual == {"k": "bs\\\\"}
+
+    def test_object_string_value_backslash_only_chunks(self, parser):
+        """Test backslash runs spanning whole chunks."""
+        parser.consume('{"a": "x')
+        parser.consume("\\")
+        parser.consume("\\")
+        parser.consume('"}')
+        actual = parser.get()
+        assert actual == {"a": "x\\\\"}
+
+    def test_object_literal_value_across_chunks(self, parser):
+        """Test literal values split across chunks."""
+        test_cases = [
+            (['{"k": nu', "ll}"], {"k": None}),
+            (['{"k": t', "ru", "e}"], {"k": True}),
+            (['{"k": fals', "e}"], {"k": False}),
+        ]
+        for chunks, expected in test_cases:
+            parser = StreamJsonParser()
+            for chunk in chunks:
+                parser.consume(chunk)
+            actual = parser.get()
+            assert actual == expected
+
+    def test_object_bare_token_malformed(self, parser):
+        """Test that a bare token that is no literal prefix is malformed."""
+        parser.consume('{"key": ')
+        with pytest.raises(StreamParserJSONDecodeError):
+            parser.consume("hello")
+
+    def test_object_bare_token_continuation_malformed(self, parser):
+        """Test that a literal continuation going off the rails is malformed."""
+        parser.consume('{"key": tru')
+        with pytest.raises(StreamParserJSONDecodeError):
+            parser.consume("xy")
+
     def test_array_streaming_edge_cases(self, parser):
         """Test edge cases in streaming array parsing."""
         # Test extremely small chunks
@@ -498,5 +572,131 @@ class TestStreamJsonParser:
         assert actual == ["test", 1, True, None]
 
 
+class TestParserReuse:
+    """Test class for reset() and get_thread_local()."""
+
+    def test_reset_clears_document(self):
+        """Test that reset() drops a complete document."""
+        parser = StreamJsonParser()
+        parser.consume('{"key": "value"}')
+        assert parser.get() == {"key": "value"}
+        parser.reset()
+        assert parser.get() is None
+
+    def test_reset_clears_partial_state(self):
+        """Test that a reset parser mid-document parses a new one cleanly."""
+        parser = StreamJsonParser()
+        parser.consume('{"key": "val')
+        parser.reset()
+        parser.consume('["test", 1]')
+        assert parser.get() == ["test", 1]
+
+    def test_get_thread_local_caches_per_thread(self):
+        """Test that each thread sees one cached parser instance."""
+        first = StreamJsonParser.get_thread_local()
+        second = StreamJsonParser.get_thread_local()
+        assert first is second
+
+        seen = []
+
+        def worker():
+            seen.append(StreamJsonParser.get_thread_local())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert seen[0] is not first
+
+
+class TestParserPool:
+    """Test class for the acquire()/release() free-list."""
+
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Start each test with an empty free-list."""
+        stream_parser._POOL.clear()
+        yield
+        stream_parser._POOL.clear()
+
+    def test_acquire_returns_usable_parser(self):
+        """Test that an acquired parser parses like a fresh one."""
+        parser = StreamJsonParser.acquire()
+        assert parser.get() is None
+        parser.consume('{"key": "value"}')
+        assert parser.get() == {"key": "value"}
+
+    def test_release_recycles_instance(self):
+        """Test that a released parser is handed out again, fully reset."""
+        parser = StreamJsonParser.acquire()
+        parser.consume('{"key": "val')
+        parser.release()
+        recycled = StreamJsonParser.acquire()
+        assert recycled is parser
+        assert recycled.get() is None
+        recycled.consume('["test"]')
+        assert recycled.get() == ["test"]
+
+    def test_pool_is_bounded(self):
+        """Test that the free-list never grows past its capacity."""
+        parsers = [StreamJsonParser() for _ in range(stream_parser._POOL_MAX + 8)]
+        for parser in parsers:
+            parser.release()
+        assert len(stream_parser._POOL) == stream_parser._POOL_MAX
+
+
+class TestFastPath:
+    """Test class for the complete-document fast path in consume()."""
+
+    @pytest.fixture(autouse=True)
+    def stdlib_decoder(self, monkeypatch):
+        """Force the stdlib decoder so both fast-path branches are covered."""
+        monkeypatch.setattr(stream_parser, "_orjson_loads", None)
+
+    def test_fast_path_matches_streaming(self):
+        """Test that single-chunk results match char-by-char streaming."""
+        # numbers are single-digit: the streaming path does not support
+        # number tokens split across chunks
+        documents = [
+            "{}",
+            "[]",
+            '{"key": "value"}',
+            '{"a": 1, "b": 2, "c": 3}',
+            '[1, "string", true, null, 7]',
+            '{"a": {}, "b": 1}',
+            "[[], []]",
+            '[{"arr": [1, 2, {"x": [3, 4]}]}, [5, {"y": 6}]]',
+            '{\n  "outer"\t: {\r\n\t  "inner": "value"\n\t  }\r\n}',
+        ]
+        for document in documents:
+            fast = StreamJsonParser()
+            fast.consume(document)
+            streamed = StreamJsonParser()
+            for character in document:
+                streamed.consume(character)
+            assert fast.get() == streamed.get()
+
+    def test_fast_path_rejects_nonstandard_constants(self):
+        """Test that NaN/Infinity are malformed, as on the streaming path."""
+        invalid_cases = [
+            '{"key": Infinity}',
+            '{"key": -Infinity}',
+            '{"key": NaN}',
+        ]
+        for json_input in invalid_cases:
+            parser = StreamJsonParser()
+            with pytest.raises(StreamParserJSONDecodeError):
+                parser.consume(json_input)
+
+    def test_fast_path_deeply_nested(self):
+        """Test that deep nesting falls back to the iterative streaming loop."""
+        depth = 2000
+        parser = StreamJsonParser()
+        parser.consume("[" * depth + "]" * depth)
+        actual = parser.get()
+        for _ in range(depth - 1):
+            actual = actual[0]
+        assert actual == []
+
+
 if __name__ == "__main__":
     pytest.main()